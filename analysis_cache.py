@@ -0,0 +1,56 @@
+"""
+Keyed Parquet caches shared by the analysis modules.
+
+Every cache lives in `<root>/<key>/`, where the key is a blake2b digest over the
+source files (size + mtime), the parameters that shaped the result and the code
+that produced it. A changed input, parameter or module simply yields a new key;
+writing a key removes the directories left by older ones.
+"""
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+
+def cache_key(sources, code, params=None):
+    """blake2b key over each source file's size and mtime, the code files and the parameters"""
+    digest = hashlib.blake2b(digest_size=16)
+    for f in sorted(sources):
+        stat = f.stat()
+        digest.update(f"{f.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    for f in code:
+        digest.update(Path(f).read_bytes())
+    digest.update(repr(sorted((params or {}).items())).encode())
+    return digest.hexdigest()
+
+
+def save_frames(cache_path, frames, meta=None):
+    """Write each frame as Parquet (and `meta` as JSON) under `cache_path`, dropping other keys"""
+    cache_path = Path(cache_path)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    for name, df in frames.items():
+        df.to_parquet(cache_path / f"{name}.parquet", engine='pyarrow', compression='zstd')
+    if meta is not None:
+        with open(cache_path / "meta.json", 'w') as f:
+            json.dump(meta, f)
+    
+    for stale in cache_path.parent.iterdir():
+        if stale != cache_path:
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def load_frames(cache_path, names, meta=False):
+    """Frames (and JSON meta) written by save_frames, or None if any is missing or unreadable"""
+    cache_path = Path(cache_path)
+    try:
+        frames = {name: pd.read_parquet(cache_path / f"{name}.parquet", engine='pyarrow') for name in names}
+        if meta:
+            with open(cache_path / "meta.json") as f:
+                frames['meta'] = json.load(f)
+    except (OSError, ValueError, pa.ArrowException):
+        return None
+    return frames
@@ -17,14 +17,20 @@ Features:
 import pandas as pd
 import numpy as np
 from pathlib import Path
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from collections import defaultdict
-from datetime import datetime, timedelta
+from scipy import sparse, stats
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from numba import njit, prange
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+from analysis_cache import cache_key, load_frames, save_frames
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # 🎨 INDIAN TRICOLOR THEME
@@ -59,10 +65,123 @@ INDIA_TEMPLATE = go.layout.Template(
 )
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ⚡ COMPILED GROUP KERNELS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@njit(parallel=True, cache=True)
+def _monthly_window_stats(vals, offsets, window):
+    """Last, head-window mean, tail-window mean, max and mean per group slice"""
+    n_groups = offsets.size - 1
+    out = np.empty((n_groups, 5))
+    
+    for g in prange(n_groups):
+        start, end = offsets[g], offsets[g + 1]
+        n = end - start
+        w = min(window, n)
+        head = 0.0
+        tail = 0.0
+        total = 0.0
+        peak = vals[start]
+        
+        for i in range(start, end):
+            v = vals[i]
+            total += v
+            if v > peak:
+                peak = v
+            if i - start < w:
+                head += v
+            if end - 1 - i < w:
+                tail += v
+        
+        out[g, 0] = vals[end - 1]
+        out[g, 1] = head / w
+        out[g, 2] = tail / w
+        out[g, 3] = peak
+        out[g, 4] = total / n
+    
+    return out
+
+
+@njit(cache=True)
+def _monthly_group_totals(vals, codes, months, n_groups, n_months):
+    """One sweep over rows in any order: per-group monthly totals and which months were observed"""
+    totals = np.zeros((n_months, n_groups))
+    seen = np.zeros((n_months, n_groups), dtype=np.bool_)
+    
+    for i in range(vals.size):
+        totals[months[i], codes[i]] += vals[i]
+        seen[months[i], codes[i]] = True
+    
+    return totals, seen
+
+
+@njit(cache=True)
+def _pairwise_sum(vals, start, n):
+    """Sum of vals[start:start + n] with numpy's pairwise summation (same rounding as ndarray.sum)"""
+    if n < 8:
+        res = -0.0
+        for i in range(start, start + n):
+            res += vals[i]
+        return res
+    elif n <= 128:
+        r = vals[start:start + 8].copy()
+        i = 8
+        while i < n - n % 8:
+            for j in range(8):
+                r[j] += vals[start + i + j]
+            i += 8
+        res = ((r[0] + r[1]) + (r[2] + r[3])) + ((r[4] + r[5]) + (r[6] + r[7]))
+        while i < n:
+            res += vals[start + i]
+            i += 1
+        return res
+    else:
+        half = n // 2
+        half -= half % 8
+        return _pairwise_sum(vals, start, half) + _pairwise_sum(vals, start + half, n - half)
+
+
+@njit(parallel=True, cache=True)
+def _segment_sums(vals, offsets):
+    """Pairwise sum of each contiguous group slice"""
+    out = np.empty(offsets.size - 1)
+    for g in prange(out.size):
+        out[g] = _pairwise_sum(vals, offsets[g], offsets[g + 1] - offsets[g])
+    return out
+
+
+def _daily_moments(vals, codes, n_groups):
+    """Per-group count, mean and M2 by the two-pass algorithm of Series.std, so ties rank as before"""
+    # Rows laid out group by group, each group keeping its original record order
+    order = np.argsort(codes, kind='stable')
+    count = np.bincount(codes, minlength=n_groups)
+    offsets = np.concatenate([[0], np.cumsum(count)])
+    vals = vals[order]
+    
+    mean = _segment_sums(vals, offsets) / count
+    m2 = _segment_sums((np.repeat(mean, count) - vals) ** 2, offsets)
+    return count.astype(np.float64), mean, m2
+
+
+def _spike_risk(count, mean, m2):
+    """Sample std relative to mean (NaN for single-record groups), capped at 2"""
+    std = np.sqrt(np.divide(m2, count - 1, out=np.full_like(m2, np.nan), where=count > 1))
+    return np.minimum(std / np.maximum(mean, 1), 2)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # 📊 DATA LOADING & PREPROCESSING
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# CSV column types: geography as Arrow-backed strings, counts as int32 (empty fields are
+# missing values, as read_csv treats them)
+BIO_CSV_OPTIONS = pa_csv.ConvertOptions(column_types={
+    'state': pa.string(), 'district': pa.string(), 'pincode': pa.string(),
+    'bio_age_5_17': pa.int32(), 'bio_age_17_': pa.int32()
+}, strings_can_be_null=True)
+
+
 class BiometricLoadForecaster:
     """Forecast biometric load and identify overloaded areas"""
     
@@ -71,133 +190,201 @@ class BiometricLoadForecaster:
         self.bio_df = None
         self.district_forecast = None
         self.pincode_forecast = None
+        self.district_monthly = None
+        self.pincode_monthly = None
+        self.daily_moments = None
+        self.district_daily_moments = None
         self.load_scores = None
         
     def load_data(self):
-        """Load biometric update data"""
+        """Load biometric update data (from the cleaned Parquet cache when fresh)"""
         print("🔄 Loading biometric update data...")
         
         bio_files = sorted(self.base_path.glob("api_data_aadhar_biometric/*.csv"))
-        self.bio_df = pd.concat([pd.read_csv(f) for f in bio_files], ignore_index=True)
+        cache_path = self.base_path / "bio_cache" / cache_key(bio_files, [__file__])
+        
+        # Cache is keyed on the CSVs and this module's preprocessing
+        cached = load_frames(cache_path, ['bio_df'])
+        if cached is not None:
+            self.bio_df = cached['bio_df']
+            print(f"   ✓ Using cached bio_cache/{cache_path.name}")
+        else:
+            # Parse the CSV parts concurrently (the parser releases the GIL) into typed
+            # Arrow tables; concat_tables only chains the chunks, so the single
+            # to_pandas() is the only full-size copy
+            read_part = partial(pa_csv.read_csv, convert_options=BIO_CSV_OPTIONS)
+            with ThreadPoolExecutor() as pool:
+                table = pa.concat_tables(pool.map(read_part, bio_files))
+            self.bio_df = table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+            del table
+            self._preprocess()
+            save_frames(cache_path, {'bio_df': self.bio_df})
         
-        # Preprocess
+        print(f"   ✓ Loaded {len(self.bio_df):,} biometric records")
+        print(f"   ✓ Date range: {self.bio_df['date'].min().strftime('%d-%b-%Y')} to {self.bio_df['date'].max().strftime('%d-%b-%Y')}")
+        
+        return self
+    
+    def _preprocess(self):
+        """Clean raw records and derive load and time features"""
         self.bio_df['date'] = pd.to_datetime(self.bio_df['date'], format='%d-%m-%Y')
+        
+        # Geography is read as Arrow-backed strings, so these run as Arrow kernels
         self.bio_df['state'] = self.bio_df['state'].str.strip().str.title()
         self.bio_df['district'] = self.bio_df['district'].str.strip().str.title()
-        self.bio_df['pincode'] = self.bio_df['pincode'].astype(str).str.zfill(6)
+        self.bio_df['pincode'] = self.bio_df['pincode'].str.pad(6, side='left', fillchar='0')
+        
+        # Categorical geography: strings stored once, groupbys hash int codes (categories as
+        # plain str, the dtype the Parquet cache reads back, so cold and cached runs agree)
+        for col in ['state', 'district', 'pincode']:
+            geo = self.bio_df[col].astype('category')
+            self.bio_df[col] = geo.cat.rename_categories(geo.cat.categories.astype(str))
         
         # Total biometric updates
         self.bio_df['total_bio'] = self.bio_df['bio_age_5_17'] + self.bio_df['bio_age_17_']
         
-        # Time features
-        self.bio_df['year_month'] = self.bio_df['date'].dt.to_period('M')
-        self.bio_df['week'] = self.bio_df['date'].dt.isocalendar().week
-        self.bio_df['month'] = self.bio_df['date'].dt.month
-        self.bio_df['day_of_week'] = self.bio_df['date'].dt.dayofweek
-        
-        print(f"   ✓ Loaded {len(self.bio_df):,} biometric records")
-        print(f"   ✓ Date range: {self.bio_df['date'].min().strftime('%d-%b-%Y')} to {self.bio_df['date'].max().strftime('%d-%b-%Y')}")
-        
-        return self
+        # Time features (compact ints; year_month is keyed as YYYYMM)
+        year = self.bio_df['date'].dt.year.astype('int32')
+        month = self.bio_df['date'].dt.month.astype('int32')
+        self.bio_df['year_month'] = year * 100 + month
+        self.bio_df['week'] = self.bio_df['date'].dt.isocalendar().week.astype('int8')
+        self.bio_df['month'] = month.astype('int8')
+        self.bio_df['day_of_week'] = self.bio_df['date'].dt.dayofweek.astype('int8')
     
     def compute_historical_stats(self):
         """Compute historical load statistics by district and pincode"""
         print("📊 Computing historical load statistics...")
         
-        # Monthly aggregation by district
-        self.district_monthly = self.bio_df.groupby(
-            ['year_month', 'state', 'district']
+        # Records with a missing key are left out, as groupby drops NaN keys (code -1 would
+        # otherwise fold into a neighbouring group's key)
+        keys = ['state', 'district', 'pincode']
+        key_codes = {col: self.bio_df[col].cat.codes.to_numpy(np.int64) for col in keys}
+        valid = np.logical_and.reduce([codes >= 0 for codes in key_codes.values()])
+        
+        # Group ids in groupby order: one int64 key per row from the categorical codes
+        geo_key = np.zeros(int(valid.sum()), dtype=np.int64)
+        for col in keys:
+            geo_key = geo_key * len(self.bio_df[col].cat.categories) + key_codes[col][valid]
+        pincode_codes, geo_keys = pd.factorize(geo_key, sort=True)
+        month_codes, months = pd.factorize(self.bio_df['year_month'].to_numpy()[valid], sort=True)
+        
+        # Decode the distinct keys back into (state, district, pincode) rows
+        pincodes = {}
+        for col in reversed(keys):
+            geo_keys, col_codes = np.divmod(geo_keys, len(self.bio_df[col].cat.categories))
+            pincodes[col] = pd.Categorical.from_codes(col_codes, dtype=self.bio_df[col].dtype)
+        pincodes = pd.DataFrame({col: pincodes[col] for col in keys})
+        
+        # Monthly totals by pincode in a single pass over the records
+        vals = self.bio_df['total_bio'].to_numpy(np.float64)[valid]
+        totals, seen = _monthly_group_totals(vals, pincode_codes, month_codes, len(pincodes), len(months))
+        
+        # Daily-load moments by pincode and by district (districts in first-seen pincode order)
+        district_ids, districts = pd.factorize(pd.MultiIndex.from_frame(pincodes[['state', 'district']]))
+        self.daily_moments = _daily_moments(vals, pincode_codes, len(pincodes))
+        self.district_daily_moments = _daily_moments(vals, district_ids[pincode_codes], len(districts))
+        
+        # Monthly aggregation by pincode (observed months only, month-major like a groupby)
+        month_idx, pincode_idx = np.nonzero(seen)
+        self.pincode_monthly = pincodes.iloc[pincode_idx].reset_index(drop=True)
+        self.pincode_monthly.insert(0, 'year_month', months[month_idx])
+        self.pincode_monthly['total_bio'] = totals[month_idx, pincode_idx].astype(self.bio_df['total_bio'].dtype)
+        
+        # Monthly aggregation by district (rolled up from the pincode totals)
+        self.district_monthly = self.pincode_monthly.groupby(
+            ['year_month', 'state', 'district'], observed=True
         )['total_bio'].sum().reset_index()
-        self.district_monthly['year_month'] = self.district_monthly['year_month'].astype(str)
         
-        # Monthly aggregation by pincode
-        self.pincode_monthly = self.bio_df.groupby(
-            ['year_month', 'state', 'district', 'pincode']
-        )['total_bio'].sum().reset_index()
-        self.pincode_monthly['year_month'] = self.pincode_monthly['year_month'].astype(str)
+        # Label months as 'YYYY-MM' (formatted once per distinct month)
+        for monthly in (self.pincode_monthly, self.district_monthly):
+            months, codes = np.unique(monthly['year_month'].to_numpy(), return_inverse=True)
+            labels = np.array([f"{ym // 100}-{ym % 100:02d}" for ym in months])
+            monthly['year_month'] = labels[codes]
         
         print(f"   ✓ {self.district_monthly['district'].nunique()} districts")
         print(f"   ✓ {self.pincode_monthly['pincode'].nunique()} pincodes")
         
         return self
     
+    def _trend_forecast(self, monthly, daily_moments, keys, window):
+        """Trend + damped forecast for every group of `keys` via compiled kernels"""
+        # Monthly totals laid out as contiguous, month-ordered group slices
+        monthly = monthly.sort_values(keys + ['year_month'])
+        sizes = monthly.groupby(keys, observed=True).size()
+        n_months = sizes.to_numpy()
+        offsets = np.concatenate([[0], np.cumsum(n_months)])
+        
+        last_month_load, early_avg, recent_avg, historical_max, historical_mean = _monthly_window_stats(
+            monthly['total_bio'].to_numpy(np.float64), offsets, window
+        ).T
+        
+        # Simple trend: difference between last `window` months and first `window` months
+        trend = np.where(
+            n_months >= window, (recent_avg - early_avg) / np.maximum(early_avg, 1), 0.0
+        )
+        
+        # Seasonality: use last month as baseline
+        forecast = sizes.index.to_frame(index=False)
+        forecast['last_month_load'] = last_month_load.astype(monthly['total_bio'].dtype)
+        forecast['trend'] = trend
+        forecast['forecast_load'] = last_month_load * (1 + trend * 0.3)  # Damped trend
+        forecast['spike_risk'] = _spike_risk(*daily_moments)  # High std relative to mean = volatile
+        forecast['historical_mean'] = historical_mean
+        forecast['historical_max'] = historical_max.astype(monthly['total_bio'].dtype)
+        
+        return forecast
+    
+    def _bottom_up_forecast(self, pincode_forecast, district_daily_moments):
+        """District forecast reconciled from its pincodes: Y_district = S @ Y_pincode"""
+        # S: 0/1 aggregation matrix mapping each pincode row to its district
+        district_ids, districts = pd.factorize(
+            pd.MultiIndex.from_frame(pincode_forecast[['state', 'district']])
+        )
+        n_pincodes = len(pincode_forecast)
+        S = sparse.csr_matrix(
+            (np.ones(n_pincodes), (district_ids, np.arange(n_pincodes))),
+            shape=(len(districts), n_pincodes)
+        )
+        
+        last_month_load = S @ pincode_forecast['last_month_load'].to_numpy(np.float64)
+        forecast_load = S @ pincode_forecast['forecast_load'].to_numpy(np.float64)
+        
+        # Implied damped trend (last-month-load weighted mean of the pincode trends)
+        trend = np.divide(
+            forecast_load - last_month_load, 0.3 * last_month_load,
+            out=np.zeros_like(forecast_load), where=last_month_load > 0
+        )
+        
+        # Historical stats are observed district totals, not forecasts
+        history = self.district_monthly.groupby(
+            ['state', 'district'], observed=True
+        )['total_bio'].agg(['mean', 'max']).reindex(districts)
+        
+        forecast = districts.to_frame(index=False, name=['state', 'district'])
+        forecast['last_month_load'] = last_month_load.astype(pincode_forecast['last_month_load'].dtype)
+        forecast['trend'] = trend
+        forecast['forecast_load'] = forecast_load
+        forecast['spike_risk'] = _spike_risk(*district_daily_moments)
+        forecast['historical_mean'] = history['mean'].to_numpy()
+        forecast['historical_max'] = history['max'].to_numpy()
+        
+        return forecast
+    
     def forecast_next_month(self):
         """Forecast next month's biometric load using trend + seasonality"""
         print("🔮 Forecasting next month's biometric load...")
         
-        # === DISTRICT LEVEL FORECAST ===
-        district_stats = self.bio_df.groupby(['state', 'district']).agg({
-            'total_bio': ['sum', 'mean', 'std', 'count'],
-            'date': ['min', 'max']
-        }).reset_index()
-        district_stats.columns = ['state', 'district', 'total_load', 'daily_mean', 
-                                   'daily_std', 'record_count', 'first_date', 'last_date']
-        
-        # Calculate trend (simple linear)
-        district_trends = []
-        for (state, district), group in self.bio_df.groupby(['state', 'district']):
-            monthly = group.groupby('year_month')['total_bio'].sum().reset_index()
-            monthly['month_num'] = range(len(monthly))
-            
-            if len(monthly) >= 3:
-                # Simple trend: difference between last 3 months and first 3 months
-                recent_avg = monthly['total_bio'].tail(3).mean()
-                early_avg = monthly['total_bio'].head(3).mean()
-                trend = (recent_avg - early_avg) / max(early_avg, 1)
-            else:
-                trend = 0
-            
-            # Seasonality: use last month as baseline
-            last_month_load = monthly['total_bio'].iloc[-1] if len(monthly) > 0 else 0
-            
-            # Forecast: last month + trend adjustment
-            forecast = last_month_load * (1 + trend * 0.3)  # Damped trend
-            
-            # Spike risk: high std relative to mean indicates volatility
-            spike_risk = group['total_bio'].std() / max(group['total_bio'].mean(), 1)
-            
-            district_trends.append({
-                'state': state,
-                'district': district,
-                'last_month_load': last_month_load,
-                'trend': trend,
-                'forecast_load': forecast,
-                'spike_risk': min(spike_risk, 2),  # Cap at 2
-                'historical_mean': group['total_bio'].sum() / max(len(monthly), 1),
-                'historical_max': monthly['total_bio'].max() if len(monthly) > 0 else 0
-            })
-        
-        self.district_forecast = pd.DataFrame(district_trends)
+        # Reuse the monthly totals instead of re-grouping the raw records
+        if self.pincode_monthly is None:
+            self.compute_historical_stats()
         
         # === PINCODE LEVEL FORECAST ===
-        pincode_trends = []
-        for (state, district, pincode), group in self.bio_df.groupby(['state', 'district', 'pincode']):
-            monthly = group.groupby('year_month')['total_bio'].sum().reset_index()
-            
-            if len(monthly) >= 2:
-                recent_avg = monthly['total_bio'].tail(2).mean()
-                early_avg = monthly['total_bio'].head(2).mean()
-                trend = (recent_avg - early_avg) / max(early_avg, 1)
-            else:
-                trend = 0
-            
-            last_month_load = monthly['total_bio'].iloc[-1] if len(monthly) > 0 else 0
-            forecast = last_month_load * (1 + trend * 0.3)
-            spike_risk = group['total_bio'].std() / max(group['total_bio'].mean(), 1)
-            
-            pincode_trends.append({
-                'state': state,
-                'district': district,
-                'pincode': pincode,
-                'last_month_load': last_month_load,
-                'trend': trend,
-                'forecast_load': forecast,
-                'spike_risk': min(spike_risk, 2),
-                'historical_mean': monthly['total_bio'].mean() if len(monthly) > 0 else 0,
-                'historical_max': monthly['total_bio'].max() if len(monthly) > 0 else 0
-            })
-        
-        self.pincode_forecast = pd.DataFrame(pincode_trends)
+        self.pincode_forecast = self._trend_forecast(
+            self.pincode_monthly, self.daily_moments, ['state', 'district', 'pincode'], window=2
+        )
+        
+        # === DISTRICT LEVEL FORECAST (bottom-up, coherent with pincodes) ===
+        self.district_forecast = self._bottom_up_forecast(self.pincode_forecast, self.district_daily_moments)
         
         print(f"   ✓ Forecasted {len(self.district_forecast)} districts")
         print(f"   ✓ Forecasted {len(self.pincode_forecast)} pincodes")
@@ -213,27 +400,39 @@ class BiometricLoadForecaster:
         
         df = self.pincode_forecast.copy()
         
-        # Normalize forecast load to percentile
-        df['load_percentile'] = df['forecast_load'].rank(pct=True)
+        # Normalize forecast load and spike risk to percentiles in one ranking pass
+        # (average ties, NaNs left unranked - same as Series.rank(pct=True))
+        values = df[['forecast_load', 'spike_risk']].to_numpy(np.float64)
+        pct = stats.rankdata(values, axis=0, nan_policy='omit') / np.sum(~np.isnan(values), axis=0)
+        df['load_percentile'] = pct[:, 0]
         
         # LoadScore: combines expected load and volatility risk
         df['load_score'] = (
-            df['load_percentile'] * 0.7 +  # Base load contribution
-            df['spike_risk'].rank(pct=True) * 0.3  # Spike risk contribution
+            pct[:, 0] * 0.7 +  # Base load contribution
+            pct[:, 1] * 0.3  # Spike risk contribution
         )
         
         # SpareCapacity: inverse of load (lower load = more spare capacity)
         df['spare_capacity'] = 1 - df['load_percentile']
         
-        # Categorize load levels
-        df['load_category'] = pd.cut(
-            df['load_score'],
-            bins=[0, 0.5, 0.75, 0.9, 1.0],
-            labels=['Low', 'Medium', 'High', 'Critical']
+        # Categorize load levels: right-closed bins (0, 0.5], (0.5, 0.75], (0.75, 0.9], (0.9, 1.0]
+        load_score = df['load_score'].to_numpy()
+        edges = np.array([0, 0.5, 0.75, 0.9, 1.0])
+        codes = np.searchsorted(edges, load_score, side='left') - 1
+        codes[(codes < 0) | (codes >= len(edges) - 1)] = -1  # Out of range / NaN
+        df['load_category'] = pd.Categorical.from_codes(
+            codes, categories=['Low', 'Medium', 'High', 'Critical'], ordered=True
         )
         
         # Identify overloaded (top 10%)
-        df['is_overloaded'] = df['load_score'] >= 0.9
+        df['is_overloaded'] = load_score >= 0.9
+        
+        # 4-digit pincode prefix as an int (neighbouring delivery areas share it)
+        df['pin4'] = df['pincode'].astype(np.int32) // np.int32(100)
+        
+        # Store the display-only inputs in single precision; the percentile, score and spare
+        # capacity columns stay float64 since rankings and thresholds read them
+        df = df.astype({col: np.float32 for col in ['forecast_load', 'spike_risk']})
         
         self.load_scores = df
         
@@ -252,9 +451,21 @@ class LoadBalancingRecommender:
     
     def __init__(self, load_scores: pd.DataFrame):
         self.load_scores = load_scores
-        self.recommendations = []
+        self.rec_df = None
+        self.alt_df = None
         self.simulation_results = None
         
+        # Candidate pool as plain arrays, pre-sorted by spare capacity
+        by_spare = load_scores.sort_values('spare_capacity', ascending=False, kind='stable')
+        self._pool_pincode = by_spare['pincode'].astype(str).to_numpy()
+        self._pool_district = by_spare['district'].astype(str).to_numpy()
+        self._pool_spare = by_spare['spare_capacity'].to_numpy()
+        self._pool_load = by_spare['forecast_load'].to_numpy()
+        
+        # Pool positions keyed for direct lookup (each stays in spare-capacity order)
+        self._by_district = by_spare.groupby(['state', 'district'], sort=False, observed=True).indices
+        self._by_prefix = by_spare.groupby('pin4', sort=False).indices
+        
     def find_alternatives(self, top_n_overloaded=20, alternatives_per_pincode=5):
         """Find alternative pincodes for overloaded areas"""
         print(f"🔍 Finding alternatives for top {top_n_overloaded} overloaded pincodes...")
@@ -264,54 +475,46 @@ class LoadBalancingRecommender:
             top_n_overloaded, 'load_score'
         )
         
-        recommendations = []
+        # Pool positions of the chosen alternatives, per overloaded pincode
+        alt_rows = []
         
-        for _, row in overloaded.iterrows():
-            pincode = row['pincode']
-            district = row['district']
-            state = row['state']
-            
+        for pincode, district, state in zip(overloaded['pincode'], overloaded['district'], overloaded['state']):
             # Find alternatives within same district with spare capacity
-            same_district = self.load_scores[
-                (self.load_scores['district'] == district) & 
-                (self.load_scores['state'] == state) &
-                (self.load_scores['pincode'] != pincode) &
-                (self.load_scores['spare_capacity'] > 0.5)  # At least 50% spare
-            ].nlargest(alternatives_per_pincode, 'spare_capacity')
+            rows = self._by_district[(state, district)]
+            rows = rows[
+                (self._pool_pincode[rows] != pincode) &
+                (self._pool_spare[rows] > 0.5)  # At least 50% spare
+            ][:alternatives_per_pincode]
             
             # If not enough in district, look at adjacent pincodes (similar prefix)
-            if len(same_district) < alternatives_per_pincode:
-                pin_prefix = pincode[:4]  # First 4 digits
-                adjacent = self.load_scores[
-                    (self.load_scores['pincode'].str[:4] == pin_prefix) &
-                    (self.load_scores['pincode'] != pincode) &
-                    (self.load_scores['spare_capacity'] > 0.3)
-                ].nlargest(alternatives_per_pincode - len(same_district), 'spare_capacity')
-                same_district = pd.concat([same_district, adjacent])
-            
-            alternatives = []
-            for _, alt in same_district.head(alternatives_per_pincode).iterrows():
-                alternatives.append({
-                    'alt_pincode': alt['pincode'],
-                    'alt_district': alt['district'],
-                    'spare_capacity': alt['spare_capacity'],
-                    'current_load': alt['forecast_load']
-                })
+            if len(rows) < alternatives_per_pincode:
+                adjacent = self._by_prefix[int(pincode) // 100]  # First 4 digits
+                adjacent = adjacent[
+                    (self._pool_pincode[adjacent] != pincode) &
+                    (self._pool_spare[adjacent] > 0.3)
+                ][:alternatives_per_pincode - len(rows)]
+                rows = np.concatenate([rows, adjacent])
             
-            recommendations.append({
-                'pincode': pincode,
-                'district': district,
-                'state': state,
-                'load_score': row['load_score'],
-                'forecast_load': row['forecast_load'],
-                'spike_risk': row['spike_risk'],
-                'alternatives': alternatives,
-                'num_alternatives': len(alternatives)
-            })
-        
-        self.recommendations = recommendations
-        
-        print(f"   ✓ Generated recommendations for {len(recommendations)} overloaded pincodes")
+            alt_rows.append(rows)
+        
+        # One row per overloaded pincode (columnar, in load_score order)
+        self.rec_df = overloaded[
+            ['pincode', 'district', 'state', 'load_score', 'forecast_load', 'spike_risk']
+        ].astype({'pincode': str, 'district': str, 'state': str}).reset_index(drop=True)
+        self.rec_df['num_alternatives'] = np.array([len(rows) for rows in alt_rows], dtype=np.int64)
+        
+        # Long-form alternatives; `rec_id` is the row of the overloaded pincode in rec_df
+        rows = np.concatenate([np.empty(0, dtype=np.intp)] + alt_rows)
+        rec_id = np.repeat(np.arange(len(self.rec_df)), self.rec_df['num_alternatives'].to_numpy())
+        self.alt_df = pd.DataFrame({
+            'overloaded_pincode': self.rec_df['pincode'].to_numpy()[rec_id],
+            'alt_pincode': self._pool_pincode[rows],
+            'alt_district': self._pool_district[rows],
+            'spare_capacity': self._pool_spare[rows],
+            'current_load': self._pool_load[rows]
+        }, index=pd.Index(rec_id, name='rec_id'))
+        
+        print(f"   ✓ Generated recommendations for {len(self.rec_df)} overloaded pincodes")
         
         return self
     
@@ -319,42 +522,27 @@ class LoadBalancingRecommender:
         """Simulate impact of redirecting load to alternatives"""
         print("🎮 Simulating load balancing scenarios...")
         
-        simulations = []
+        loads = self.rec_df['forecast_load'].to_numpy(np.float64)
+        has_alt = self.rec_df['num_alternatives'].to_numpy() > 0
         
-        for pct in redirect_percentages:
-            total_original_peak = 0
-            total_new_peak = 0
-            total_redirected = 0
-            
-            for rec in self.recommendations:
-                original_load = rec['forecast_load']
-                total_original_peak += original_load
-                
-                # Amount to redirect
-                redirect_amount = original_load * (pct / 100)
-                
-                # Distribute among alternatives
-                if rec['alternatives']:
-                    per_alt = redirect_amount / len(rec['alternatives'])
-                    
-                    # New load for overloaded pincode
-                    new_load = original_load - redirect_amount
-                    total_new_peak += new_load
-                    total_redirected += redirect_amount
-                else:
-                    total_new_peak += original_load
-            
-            reduction_pct = ((total_original_peak - total_new_peak) / total_original_peak * 100) if total_original_peak > 0 else 0
-            
-            simulations.append({
-                'redirect_percentage': pct,
-                'original_peak_load': total_original_peak,
-                'new_peak_load': total_new_peak,
-                'total_redirected': total_redirected,
-                'peak_reduction_pct': reduction_pct
-            })
+        # Only pincodes with alternatives can shed load; all scenarios at once
+        pcts = np.asarray(redirect_percentages, dtype=np.float64) / 100
+        total_original_peak = loads.sum()
+        total_redirected = pcts * loads[has_alt].sum()
+        total_new_peak = total_original_peak - total_redirected
+        
+        if total_original_peak > 0:
+            reduction_pct = total_redirected / total_original_peak * 100
+        else:
+            reduction_pct = np.zeros_like(pcts)
         
-        self.simulation_results = pd.DataFrame(simulations)
+        self.simulation_results = pd.DataFrame({
+            'redirect_percentage': redirect_percentages,
+            'original_peak_load': total_original_peak,
+            'new_peak_load': total_new_peak,
+            'total_redirected': total_redirected,
+            'peak_reduction_pct': reduction_pct
+        })
         
         print(f"   ✓ Simulated {len(redirect_percentages)} scenarios")
         
@@ -362,9 +550,9 @@ class LoadBalancingRecommender:
     
     def get_summary_stats(self):
         """Get summary statistics"""
-        total_overloaded = len(self.recommendations)
-        avg_alternatives = np.mean([r['num_alternatives'] for r in self.recommendations])
-        total_forecast_load = sum([r['forecast_load'] for r in self.recommendations])
+        total_overloaded = len(self.rec_df)
+        avg_alternatives = self.rec_df['num_alternatives'].mean()
+        total_forecast_load = self.rec_df['forecast_load'].sum()
         
         # Best scenario
         if self.simulation_results is not None:
@@ -430,11 +618,11 @@ class LoadBalancerVisualizer:
         """Create chart of top overloaded pincodes"""
         print("📊 Creating top overloaded pincodes chart...")
         
-        recs = self.recommender.recommendations[:top_n]
+        recs = self.recommender.rec_df.head(top_n)
         
-        pincodes = [f"{r['pincode']}<br>({r['district'][:15]})" for r in recs]
-        load_scores = [r['load_score'] for r in recs]
-        forecast_loads = [r['forecast_load'] for r in recs]
+        pincodes = (recs['pincode'] + '<br>(' + recs['district'].str.slice(0, 15) + ')').tolist()
+        load_scores = recs['load_score'].tolist()
+        forecast_loads = recs['forecast_load'].tolist()
         
         fig = make_subplots(
             rows=1, cols=2,
@@ -559,21 +747,28 @@ class LoadBalancerVisualizer:
         """Create visual recommendations table"""
         print("📊 Creating recommendations visualization...")
         
-        recs = self.recommender.recommendations[:top_n]
+        recs = self.recommender.rec_df.head(top_n)
+        top_alternative = self.recommender.alt_df.groupby(level='rec_id')['alt_pincode'].first()
         
         # Create table data
         header_values = ['Overloaded Pincode', 'District', 'Load Score', 
                          'Forecast Load', 'Alternatives', 'Top Alternative']
         
         cell_values = [
-            [r['pincode'] for r in recs],
-            [r['district'][:20] for r in recs],
-            [f"{r['load_score']:.2f}" for r in recs],
-            [f"{int(r['forecast_load']):,}" for r in recs],
-            [r['num_alternatives'] for r in recs],
-            [r['alternatives'][0]['alt_pincode'] if r['alternatives'] else 'None' for r in recs]
+            recs['pincode'].tolist(),
+            recs['district'].str.slice(0, 20).tolist(),
+            [f"{s:.2f}" for s in recs['load_score']],
+            [f"{int(f):,}" for f in recs['forecast_load']],
+            recs['num_alternatives'].tolist(),
+            top_alternative.reindex(recs.index, fill_value='None').tolist()
         ]
         
+        # Highlight colours (score compared at the displayed 2-decimal precision)
+        colors_score = np.where(recs['load_score'].round(2).to_numpy() > 0.95,
+                                INDIA_COLORS['red'], INDIA_COLORS['saffron']).tolist()
+        colors_alt = np.where(recs['num_alternatives'].to_numpy() >= 3,
+                              INDIA_COLORS['green'], INDIA_COLORS['saffron']).tolist()
+        
         fig = go.Figure(data=[go.Table(
             header=dict(
                 values=header_values,
@@ -587,11 +782,9 @@ class LoadBalancerVisualizer:
                 fill_color=[
                     [INDIA_COLORS['background']] * len(recs),
                     [INDIA_COLORS['background']] * len(recs),
-                    [[INDIA_COLORS['red'] if float(v) > 0.95 else INDIA_COLORS['saffron'] 
-                      for v in cell_values[2]]],
+                    [colors_score],
                     [INDIA_COLORS['background']] * len(recs),
-                    [[INDIA_COLORS['green'] if v >= 3 else INDIA_COLORS['saffron'] 
-                      for v in cell_values[4]]],
+                    [colors_alt],
                     [INDIA_COLORS['green_dark']] * len(recs)
                 ],
                 font=dict(color=INDIA_COLORS['text'], size=12),
@@ -712,10 +905,15 @@ class LoadBalancerVisualizer:
         
         print(f"\n💾 Saving visualizations to {output_dir}/")
         
-        for name, fig in self.figures.items():
-            filepath = output_path / f"{name}.html"
-            fig.write_html(str(filepath))
-            print(f"   ✓ Saved {name}.html")
+        def save(item):
+            name, fig = item
+            # plotly.js is loaded from the CDN rather than embedded in every file
+            fig.write_html(str(output_path / f"{name}.html"), include_plotlyjs='cdn', validate=False)
+            return name
+        
+        with ThreadPoolExecutor(max_workers=min(8, max(len(self.figures), 1))) as pool:
+            for name in pool.map(save, self.figures.items()):
+                print(f"   ✓ Saved {name}.html")
         
         return output_path
 
@@ -724,14 +922,16 @@ class LoadBalancerVisualizer:
 # 🚀 MAIN EXECUTION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def run_load_balancer_analysis(data_path: str = "."):
-    """Run complete load balancer analysis"""
-    
-    print("=" * 80)
-    print("🇮🇳 BIOMETRIC LOAD BALANCER - OPS IMPACT MODULE")
-    print("=" * 80)
-    print()
-    
+# Forecaster and recommender state persisted between runs (the raw records come from the
+# bio_cache instead; daily moments are stored as count/mean/m2 frames)
+FORECASTER_FRAMES = ['district_monthly', 'pincode_monthly', 'pincode_forecast', 'district_forecast', 'load_scores']
+RECOMMENDER_FRAMES = ['rec_df', 'alt_df', 'simulation_results']
+MOMENT_FRAMES = ['daily_moments', 'district_daily_moments']
+
+
+def _fit_load_balancer(data_path, top_n_overloaded=20, alternatives_per_pincode=5,
+                       redirect_percentages=(10, 15, 20, 25, 30)):
+    """Forecast load scores and build recommendations from the raw records"""
     # 1. Load and forecast
     forecaster = BiometricLoadForecaster(data_path)
     forecaster.load_data()
@@ -743,8 +943,59 @@ def run_load_balancer_analysis(data_path: str = "."):
     
     # 2. Generate recommendations
     recommender = LoadBalancingRecommender(forecaster.load_scores)
-    recommender.find_alternatives(top_n_overloaded=20, alternatives_per_pincode=5)
-    recommender.simulate_load_balancing([10, 15, 20, 25, 30])
+    recommender.find_alternatives(top_n_overloaded=top_n_overloaded, alternatives_per_pincode=alternatives_per_pincode)
+    recommender.simulate_load_balancing(list(redirect_percentages))
+    
+    return forecaster, recommender
+
+
+def _result_frames(forecaster, recommender):
+    """Every frame the forecaster and recommender expose, keyed for the result cache"""
+    frames = {name: getattr(forecaster, name) for name in FORECASTER_FRAMES}
+    frames.update({name: getattr(recommender, name) for name in RECOMMENDER_FRAMES})
+    frames.update({
+        name: pd.DataFrame(dict(zip(['count', 'mean', 'm2'], getattr(forecaster, name)))) for name in MOMENT_FRAMES
+    })
+    return frames
+
+
+def _restore_load_balancer(data_path, frames):
+    """Rebuild the forecaster and recommender, in the same state as a fresh fit, from cached frames"""
+    forecaster = BiometricLoadForecaster(data_path)
+    forecaster.load_data()
+    for name in FORECASTER_FRAMES:
+        setattr(forecaster, name, frames[name])
+    for name in MOMENT_FRAMES:
+        setattr(forecaster, name, tuple(frames[name][col].to_numpy() for col in ['count', 'mean', 'm2']))
+    
+    recommender = LoadBalancingRecommender(forecaster.load_scores)
+    for name in RECOMMENDER_FRAMES:
+        setattr(recommender, name, frames[name])
+    
+    return forecaster, recommender
+
+
+def run_load_balancer_analysis(data_path: str = ".", use_cache: bool = True):
+    """Run complete load balancer analysis"""
+    
+    print("=" * 80)
+    print("🇮🇳 BIOMETRIC LOAD BALANCER - OPS IMPACT MODULE")
+    print("=" * 80)
+    print()
+    
+    # 1-2. Forecast + recommendations, restored from the cached frames while the data, the
+    # fit parameters and this module are unchanged (the same objects a fresh fit returns)
+    params = dict(top_n_overloaded=20, alternatives_per_pincode=5, redirect_percentages=(10, 15, 20, 25, 30))
+    bio_files = sorted(Path(data_path).glob("api_data_aadhar_biometric/*.csv"))
+    cache_path = Path(data_path) / "lb_cache" / cache_key(bio_files, [__file__], params)
+    
+    frames = load_frames(cache_path, FORECASTER_FRAMES + RECOMMENDER_FRAMES + MOMENT_FRAMES) if use_cache else None
+    if frames is not None:
+        forecaster, recommender = _restore_load_balancer(data_path, frames)
+        print(f"   ✓ Using cached forecast and recommendations from lb_cache/{cache_path.name}")
+    else:
+        forecaster, recommender = _fit_load_balancer(data_path, **params)
+        save_frames(cache_path, _result_frames(forecaster, recommender))
     
     print()
     
@@ -775,11 +1026,18 @@ def run_load_balancer_analysis(data_path: str = "."):
     
     print("\n🎯 TOP 10 OVERLOADED PINCODES:")
     print("-" * 70)
-    for i, rec in enumerate(recommender.recommendations[:10], 1):
-        alt_str = ", ".join([a['alt_pincode'] for a in rec['alternatives'][:3]]) if rec['alternatives'] else "None"
-        print(f"   {i:2d}. {rec['pincode']} ({rec['district'][:20]})")
-        print(f"       Load Score: {rec['load_score']:.3f} | Forecast: {int(rec['forecast_load']):,}")
-        print(f"       Alternatives: {alt_str}")
+    top = recommender.rec_df.head(10)
+    alt_df = recommender.alt_df
+    first_alts = alt_df[alt_df.groupby(level='rec_id').cumcount().to_numpy() < 3]
+    alt_strs = first_alts.groupby(level='rec_id')['alt_pincode'].agg(", ".join).reindex(top.index, fill_value="None")
+    rank = pd.Series(np.arange(1, len(top) + 1), index=top.index).map("{:2d}".format)
+    lines = (
+        "   " + rank + ". " + top['pincode'] + " (" + top['district'].str.slice(0, 20) + ")\n"
+        + "       Load Score: " + top['load_score'].map("{:.3f}".format)
+        + " | Forecast: " + top['forecast_load'].astype(np.int64).map("{:,}".format) + "\n"
+        + "       Alternatives: " + alt_strs
+    )
+    print("\n".join(lines))
     
     print("\n" + "=" * 80)
     print("✅ Analysis Complete!")
@@ -790,4 +1048,6 @@ def run_load_balancer_analysis(data_path: str = "."):
 
 
 if __name__ == "__main__":
-    forecaster, recommender, visualizer = run_load_balancer_analysis("/Users/lrao/Desktop/aadhar")
+    # Data folders sit next to this script unless a data directory is given
+    data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent
+    forecaster, recommender, visualizer = run_load_balancer_analysis(data_dir)
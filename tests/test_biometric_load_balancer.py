@@ -0,0 +1,158 @@
+"""
+Regression tests: the compiled forecasting path against the original pandas implementation
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import biometric_load_balancer as lb
+
+
+def _synthetic_records(seed=7):
+    """Small biometric extract with repeated and permuted daily loads, so spike risks tie or nearly tie"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2025-03-01', '2025-07-31', freq='D')
+    rows = []
+    
+    for p in range(60):
+        state, district = f"State {p % 3}", f"District {p % 7}"
+        pincode = 110000 + p * 10
+        n = 1 if p == 0 else int(rng.integers(5, 150))
+        days = np.sort(rng.choice(len(dates), n, replace=False))
+        young = rng.integers(0, 40, n)
+        adult = rng.integers(0, 60, n)
+        if p % 5 == 4:
+            # Same daily loads as the previous pincode in a shuffled order
+            young, adult = rows[-1][4][::-1], rows[-1][5][::-1]
+            days = rows[-1][3]
+        rows.append((state, district, pincode, days, young, adult))
+    
+    return pd.concat([
+        pd.DataFrame({
+            'date': dates[days].strftime('%d-%m-%Y'),
+            'state': f" {state.lower()} ",
+            'district': district,
+            'pincode': pincode,
+            'bio_age_5_17': young,
+            'bio_age_17_': adult
+        })
+        for state, district, pincode, days, young, adult in rows
+    ], ignore_index=True).sample(frac=1, random_state=seed)
+
+
+@pytest.fixture(scope='module')
+def records():
+    return _synthetic_records()
+
+
+def _fit_forecaster(records, base_path):
+    """Run the forecaster over `records` written as two CSV parts"""
+    (base_path / "api_data_aadhar_biometric").mkdir()
+    records.iloc[:len(records) // 2].to_csv(base_path / "api_data_aadhar_biometric" / "part_0.csv", index=False)
+    records.iloc[len(records) // 2:].to_csv(base_path / "api_data_aadhar_biometric" / "part_1.csv", index=False)
+    
+    forecaster = lb.BiometricLoadForecaster(base_path)
+    forecaster.load_data()
+    forecaster.compute_historical_stats()
+    forecaster.forecast_next_month()
+    forecaster.calculate_load_scores()
+    return forecaster
+
+
+@pytest.fixture(scope='module')
+def forecaster(records, tmp_path_factory):
+    return _fit_forecaster(records, tmp_path_factory.mktemp('data'))
+
+
+def _reference_pincode_forecast(records):
+    """Per-pincode forecast exactly as the original groupby loop computed it"""
+    df = records.copy()
+    df['state'] = df['state'].str.strip().str.title()
+    df['district'] = df['district'].str.strip().str.title()
+    df['pincode'] = df['pincode'].astype(str).str.zfill(6)
+    df['total_bio'] = df['bio_age_5_17'] + df['bio_age_17_']
+    df['year_month'] = pd.to_datetime(df['date'], format='%d-%m-%Y').dt.to_period('M')
+    
+    trends = []
+    for (state, district, pincode), group in df.groupby(['state', 'district', 'pincode']):
+        monthly = group.groupby('year_month')['total_bio'].sum().reset_index()
+        
+        if len(monthly) >= 2:
+            recent_avg = monthly['total_bio'].tail(2).mean()
+            early_avg = monthly['total_bio'].head(2).mean()
+            trend = (recent_avg - early_avg) / max(early_avg, 1)
+        else:
+            trend = 0
+        
+        last_month_load = monthly['total_bio'].iloc[-1]
+        spike_risk = group['total_bio'].std() / max(group['total_bio'].mean(), 1)
+        trends.append({
+            'state': state,
+            'district': district,
+            'pincode': pincode,
+            'last_month_load': last_month_load,
+            'trend': trend,
+            'forecast_load': last_month_load * (1 + trend * 0.3),
+            'spike_risk': min(spike_risk, 2),
+            'historical_mean': monthly['total_bio'].mean(),
+            'historical_max': monthly['total_bio'].max()
+        })
+    
+    return pd.DataFrame(trends)
+
+
+def test_load_score_matches_pandas_ranking(records, forecaster):
+    """Load scores equal the original rank(pct=True) scoring, ties included"""
+    reference = _reference_pincode_forecast(records)
+    load_percentile = reference['forecast_load'].rank(pct=True)
+    load_score = load_percentile * 0.7 + reference['spike_risk'].rank(pct=True) * 0.3
+    
+    scores = forecaster.load_scores
+    np.testing.assert_array_equal(scores['pincode'].astype(str).to_numpy(), reference['pincode'].to_numpy())
+    np.testing.assert_array_equal(scores['load_score'].to_numpy(), load_score.to_numpy())
+    np.testing.assert_array_equal(scores['is_overloaded'].to_numpy(), (load_score >= 0.9).to_numpy())
+
+
+def test_pincode_forecast_matches_pandas(records, forecaster):
+    """Window stats and spike risk from the compiled kernels equal the pandas groupby values"""
+    reference = _reference_pincode_forecast(records)
+    forecast = forecaster.pincode_forecast
+    
+    np.testing.assert_array_equal(forecast['pincode'].astype(str).to_numpy(), reference['pincode'].to_numpy())
+    for col in ['last_month_load', 'trend', 'forecast_load', 'spike_risk', 'historical_mean', 'historical_max']:
+        np.testing.assert_array_equal(forecast[col].to_numpy(np.float64), reference[col].to_numpy(np.float64),
+                                      err_msg=col)
+
+
+def test_district_spike_risk_matches_pandas(records, forecaster):
+    """District spike risk is the std/mean of the district's own daily records"""
+    df = records.assign(
+        state=records['state'].str.strip().str.title(),
+        total_bio=records['bio_age_5_17'] + records['bio_age_17_']
+    )
+    # Series.std per group, as the original loop did (the groupby std reduction rounds differently)
+    reference = df.groupby(['state', 'district'])['total_bio'].apply(
+        lambda group: min(group.std() / max(group.mean(), 1), 2)
+    )
+    
+    forecast = forecaster.district_forecast.set_index(['state', 'district'])['spike_risk']
+    reference = reference.reindex(forecast.index.map(lambda key: tuple(map(str, key))))
+    np.testing.assert_array_equal(forecast.to_numpy(), reference.to_numpy())
+
+
+def test_records_with_missing_keys_are_dropped(records, tmp_path):
+    """Rows with a missing state, district or pincode are left out, as the groupby dropped them"""
+    gaps = records.copy()
+    gaps['district'] = gaps['district'].astype(object)
+    gaps['pincode'] = gaps['pincode'].astype(object)
+    gaps.iloc[::17, gaps.columns.get_loc('district')] = None
+    gaps.iloc[5::23, gaps.columns.get_loc('pincode')] = None
+    
+    reference = _reference_pincode_forecast(records[gaps['district'].notna() & gaps['pincode'].notna()])
+    forecast = _fit_forecaster(gaps, tmp_path).pincode_forecast
+    
+    np.testing.assert_array_equal(forecast['pincode'].astype(str).to_numpy(), reference['pincode'].to_numpy())
+    for col in ['last_month_load', 'forecast_load', 'spike_risk']:
+        np.testing.assert_array_equal(forecast[col].to_numpy(np.float64), reference[col].to_numpy(np.float64),
+                                      err_msg=col)
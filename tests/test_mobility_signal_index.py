@@ -0,0 +1,234 @@
+"""
+Regression tests: the vectorized MSI engine against the original pandas implementation
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mobility_signal_index_analysis as msi
+
+
+def _synthetic_activity(seed=11, n_weeks=16):
+    """Weekly district activity with flat series, zero weeks, gaps and under-connected states"""
+    rng = np.random.default_rng(seed)
+    weeks = [f"2025-W{w:02d}" for w in range(10, 10 + n_weeks)]
+    districts = {'Alpha': 7, 'Beta': 2, 'Gamma': 4}  # Beta's districts have a single neighbor
+    rows = []
+    
+    for state, n_districts in districts.items():
+        for d in range(n_districts):
+            if state == 'Gamma' and d == 0:
+                series = np.full(n_weeks, 40)  # Constant windows: correlation falls back to 0
+            else:
+                series = rng.integers(0, 120, n_weeks)
+                series[rng.random(n_weeks) < 0.15] = 0  # Zero weeks: infinite/undefined changes
+            for week, value in zip(weeks, series):
+                if state == 'Alpha' and d == 1 and week == weeks[5]:
+                    continue  # Missing week: pivot fills it with 0
+                # Two records per week, so the grid sums several rows per cell
+                rows += [(state, f"District {d}", week, value // 2), (state, f"District {d}", week, value - value // 2)]
+    
+    data = pd.DataFrame(rows, columns=['state', 'district', 'year_week', 'total_activity'])
+    data['total_activity'] = data['total_activity'].astype(np.float32)
+    return data.astype({'state': 'category', 'district': 'category'})
+
+
+@pytest.fixture(scope='module')
+def data():
+    return _synthetic_activity()
+
+
+@pytest.fixture(scope='module')
+def engine(data):
+    engine = msi.MobilitySignalIndexEngine(data)
+    engine.build_neighbor_graph(level='district')
+    engine.compute_temporal_changes()
+    engine.compute_msi(window_size=3)
+    engine.detect_wave_patterns(min_duration=3, min_spread=3)
+    return engine
+
+
+def _reference_temporal(data):
+    """Pivot, percentage changes and rolling z-scores as the original groupby/pivot computed them"""
+    data = data.astype({'state': str, 'district': str})
+    agg = data.groupby(['year_week', 'state', 'district'])['total_activity'].sum().reset_index()
+    agg['geo_key'] = agg['state'] + '|' + agg['district']
+    pivot = agg.pivot(index='year_week', columns='geo_key', values='total_activity').fillna(0).astype(np.float64)
+    
+    pct_change = pivot.pct_change().replace([np.inf, -np.inf], np.nan).fillna(0)
+    rolling_mean = pivot.rolling(window=4, min_periods=1).mean()
+    rolling_std = pivot.rolling(window=4, min_periods=1).std().replace(0, 1)
+    return pivot, pct_change, (pivot - rolling_mean) / rolling_std
+
+
+def _reference_msi(pivot, changes, zscores, neighbors, window_size=3):
+    """MSI records from the original per-location, per-period loop"""
+    records = []
+    locations = list(changes.columns)
+    time_periods = list(changes.index)
+    
+    for loc in locations:
+        valid_neighbors = [n for n in neighbors.get(loc, []) if n in locations]
+        if len(valid_neighbors) < 2:
+            continue
+        
+        for t_idx in range(window_size, len(time_periods)):
+            t = time_periods[t_idx]
+            t_window = time_periods[t_idx - window_size:t_idx + 1]
+            loc_changes = changes.loc[t_window, loc].values
+            neighbor_changes = changes.loc[t_window, valid_neighbors].mean(axis=1).values
+            
+            if len(loc_changes) > 2 and np.std(loc_changes) > 0 and np.std(neighbor_changes) > 0:
+                inverse_corr = -np.corrcoef(loc_changes, neighbor_changes)[0, 1]
+            else:
+                inverse_corr = 0
+            
+            loc_direction = np.sign(loc_changes[-1])
+            neighbor_directions = np.sign(changes.loc[t, valid_neighbors].values)
+            opposite_count = np.sum(neighbor_directions != loc_direction) if loc_direction != 0 else 0
+            spatial_spread = opposite_count / len(valid_neighbors)
+            z_magnitude = abs(zscores.loc[t, loc])
+            
+            records.append({
+                'time_period': t,
+                'geo_key': loc,
+                'msi_score': inverse_corr * (1 + spatial_spread) * min(z_magnitude, 3) / 3,
+                'inverse_correlation': inverse_corr,
+                'spatial_spread': spatial_spread,
+                'z_magnitude': z_magnitude,
+                'activity_change_pct': changes.loc[t, loc] * 100,
+                'neighbor_change_pct': changes.loc[t, valid_neighbors].mean() * 100,
+                'activity_level': pivot.loc[t, loc],
+                'neighbor_activity': pivot.loc[t, valid_neighbors].mean(),
+                'num_neighbors': len(valid_neighbors),
+                'neighbors_opposite': opposite_count
+            })
+    
+    return pd.DataFrame(records)
+
+
+def test_temporal_grid_matches_pivot(data, engine):
+    """Bincount pivot, percentage changes and rolling z-scores equal the pandas pivot/rolling path"""
+    pivot, pct_change, zscores = _reference_temporal(data)
+    
+    pd.testing.assert_frame_equal(engine.temporal_pivot.astype(np.float64), pivot, check_names=False)
+    pd.testing.assert_frame_equal(engine.temporal_changes, pct_change, check_names=False)
+    pd.testing.assert_frame_equal(engine.temporal_zscores, zscores, check_names=False, rtol=1e-12)
+
+
+def test_rolling_zscores_edge_cases():
+    """First row is NaN (ddof=1 over one value), flat windows divide by 1, NaN inputs are skipped"""
+    values = np.array([[5.0, 2.0, 1.0], [5.0, 4.0, np.nan], [5.0, 9.0, 3.0], [5.0, 1.0, 8.0], [5.0, 6.0, 2.0]])
+    frame = pd.DataFrame(values)
+    expected = (frame - frame.rolling(4, min_periods=1).mean()) / frame.rolling(4, min_periods=1).std().replace(0, 1)
+    
+    z = msi._rolling_zscores(values, window=4)
+    assert np.isnan(z[0]).all()
+    np.testing.assert_array_equal(z[1:, 0], 0.0)
+    assert np.isnan(z[1, 2])
+    np.testing.assert_allclose(z[2:, :2], expected.to_numpy()[2:, :2], rtol=1e-12)
+
+
+def test_msi_matches_reference_loop(data, engine):
+    """Kernel output equals the original loop, including the zero-correlation fallback and neighbor filter"""
+    pivot, pct_change, zscores = _reference_temporal(data)
+    reference = _reference_msi(pivot, pct_change, zscores, engine.district_neighbors)
+    
+    result = engine.msi_results.astype({'time_period': str, 'geo_key': str})
+    result = result.sort_values(['geo_key', 'time_period']).reset_index(drop=True)
+    reference = reference.sort_values(['geo_key', 'time_period']).reset_index(drop=True)
+    
+    # Under-connected locations (Beta) are skipped; the flat Gamma series never scores
+    assert not result['geo_key'].str.startswith('Beta|').any()
+    assert (result.loc[result['geo_key'] == 'Gamma|District 0', 'inverse_correlation'] == 0).all()
+    
+    pd.testing.assert_frame_equal(result[['time_period', 'geo_key']], reference[['time_period', 'geo_key']])
+    for col in reference.columns[2:]:
+        np.testing.assert_allclose(result[col].to_numpy(np.float64), reference[col].to_numpy(np.float64),
+                                   rtol=1e-9, atol=1e-12, err_msg=col)
+
+
+def test_msi_independent_of_build_order(data, engine):
+    """Building the neighbor graph after the temporal changes gives the same MSI rows"""
+    late = msi.MobilitySignalIndexEngine(data)
+    late.compute_temporal_changes()
+    late.build_neighbor_graph(level='district')
+    late.compute_msi(window_size=3)
+    
+    pd.testing.assert_frame_equal(late.msi_results, engine.msi_results)
+
+
+def test_state_stats_match_groupby(engine):
+    """Bincount state statistics equal the groupby aggregation they replaced"""
+    viz = msi.MSIVisualizer(engine)
+    viz._compute_cached_aggregates()
+    
+    results = engine.msi_results
+    expected = results.groupby('state', observed=True).agg({
+        'msi_score': ['mean', 'max', 'std'],
+        'activity_level': 'mean',
+        'spatial_spread': 'mean',
+        'district': 'nunique'
+    }).reset_index()
+    expected.columns = ['state', 'msi_mean', 'msi_max', 'msi_std', 'avg_activity', 'avg_spread', 'num_districts']
+    expected = expected.sort_values('msi_mean', ascending=True)
+    
+    pd.testing.assert_frame_equal(
+        viz._state_stats.astype({'state': str}).reset_index(drop=True),
+        expected.astype({'state': str}).reset_index(drop=True),
+        check_dtype=False, rtol=1e-12
+    )
+
+
+def _reference_waves(results, min_duration=3, min_spread=3):
+    """Wave patterns from the original per-state scan over DataFrame filters"""
+    waves = []
+    high_msi = results[results['msi_score'] > 0.3]
+    
+    for state in high_msi['state'].unique():
+        state_data = high_msi[high_msi['state'] == state]
+        time_periods = sorted(state_data['time_period'].unique())
+        
+        for start_idx, start_time in enumerate(time_periods[:-min_duration]):
+            initial = set(state_data.loc[state_data['time_period'] == start_time, 'district'])
+            affected = {start_time: initial}
+            cumulative = set(initial)
+            for t in time_periods[start_idx + 1:start_idx + min_duration + 2]:
+                affected[t] = set(state_data.loc[state_data['time_period'] == t, 'district'])
+                cumulative |= affected[t]
+            
+            counts = [len(d) for d in affected.values()]
+            if len(cumulative) >= min_spread and max(counts) > counts[0]:
+                waves.append({
+                    'state': state,
+                    'start_time': start_time,
+                    'peak_time': list(affected)[int(np.argmax(counts))],
+                    'duration': len(affected),
+                    'origin_districts': sorted(initial),
+                    'total_affected': len(cumulative),
+                    'all_districts': sorted(cumulative),
+                    'spread_sequence': {str(k): sorted(v) for k, v in affected.items()},
+                    'peak_count': max(counts),
+                    'wave_score': len(cumulative) * max(counts) / (len(initial) + 1)
+                })
+    
+    return waves
+
+
+def test_waves_match_reference_scan(engine):
+    """Set-based wave sweep finds the same waves as the original scan (district lists compared as sets)"""
+    results = engine.msi_results.astype({'state': str, 'district': str, 'time_period': str})
+    reference = _reference_waves(results)
+    assert reference, "synthetic data should contain at least one wave"
+    
+    def normalized(waves):
+        out = []
+        for wave in waves:
+            wave = dict(wave, origin_districts=sorted(wave['origin_districts']),
+                        all_districts=sorted(wave['all_districts']),
+                        spread_sequence={k: sorted(v) for k, v in wave['spread_sequence'].items()})
+            out.append(wave)
+        return sorted(out, key=lambda w: (-w['wave_score'], w['state'], w['start_time']))
+    
+    assert normalized(engine.wave_patterns) == normalized(reference)